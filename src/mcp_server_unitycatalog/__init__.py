@@ -7,12 +7,11 @@ License:
 MIT License (c) 2025 Shingo OKAWA
 """
 
-import logging
 import sys
+import threading
+from importlib import import_module
 from traceback import format_exc
 from mcp_server_unitycatalog.cli import get_settings as Cli
-from mcp_server_unitycatalog.config import configure
-from mcp_server_unitycatalog.server import start
 
 
 def main() -> None:
@@ -27,7 +26,17 @@ def main() -> None:
     """
     import asyncio
 
+    # NOTE:
+    # `server` pulls in `mcp` and `unitycatalog`, which dominate the startup time. Hence, those
+    # imports are deferred until the CLI arguments are validated, while being warmed up on a
+    # background thread in the meantime so that `--help` and argument errors return promptly.
+    threading.Thread(
+        target=import_module, args=("mcp_server_unitycatalog.server",), daemon=True
+    ).start()
     cli = Cli()
+    from mcp_server_unitycatalog.config import configure
+    from mcp_server_unitycatalog.server import start
+
     configure(cli)
     asyncio.run(
         start(
@@ -10,7 +10,7 @@ License:
 MIT License (c) 2025 Shingo Okawa
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal, Optional
 from pathlib import Path
 from pydantic import AliasChoices, Field
@@ -74,6 +74,30 @@ class Cli(BaseSettings):
         validation_alias=AliasChoices("l", "uc_log_directory"),
     )
 
+    @classmethod
+    def from_env(cls) -> "Cli":
+        """Loads the configuration from environment variables only.
+
+        Unlike the default constructor, this skips parsing `sys.argv`, which is
+        unnecessary overhead for programmatic use (e.g., tests or embedding).
+
+        Returns:
+            Cli: An instance of the `Cli` class loaded without CLI argument parsing.
+        """
+        return cls(_cli_parse_args=False)  # pyright: ignore[reportCallIssue]
+
+    @cached_property
+    def function_name_prefix(self) -> str:
+        """Returns the prefix which fully qualifies function names within the schema.
+
+        The prefix is computed once per instance, so that fully-qualified function names
+        can be built by a single string concatenation on the request path.
+
+        Returns:
+            str: The prefix in the format of "<catalog>.<schema>.".
+        """
+        return f"{self.uc_catalog}.{self.uc_schema}."
+
 
 @lru_cache
 def get_settings():
@@ -5,16 +5,23 @@ throughout the application.
 
 Features:
 - Configures logging with different verbosity levels.
+- Buffers file log writes and flushes them periodically.
+- Rotates log files at midnight.
+- Offloads log handling to a background thread via a queue.
 
 License:
 MIT License (c) 2025 Shingo OKAWA
 """
 
+import atexit
 import logging
+import queue
 import sys
-from datetime import datetime
-from logging import FileHandler, Formatter, StreamHandler
+import threading
+from logging import Formatter, LogRecord, StreamHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from typing import Optional, Union
 from mcp_server_unitycatalog.cli import Cli
 
 
@@ -22,6 +29,133 @@ from mcp_server_unitycatalog.cli import Cli
 FORMAT = "%(asctime)s,%(msecs)d - %(name)s - %(levelname)s - %(message)s"
 # Defines logging date format.
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Maps verbosity levels accepted by the CLI to logging levels.
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+# Defines the buffer size (in bytes) of the log file stream.
+BUFFER_SIZE = 65536
+# Defines the interval (in seconds) between periodic log file flushes.
+FLUSH_INTERVAL = 3.0
+# Defines the number of rotated log files to keep.
+BACKUP_COUNT = 14
+
+
+class BufferedRotatingFileHandler(TimedRotatingFileHandler):
+    """A rotating file handler which coalesces log records into large physical writes.
+
+    The log file is rotated at midnight, keeping `backupCount` rotated files. The
+    standard `FileHandler` flushes its stream after every record, so each log line
+    costs one `write` syscall. This handler opens the log file with a large buffer and
+    only flushes it periodically from a background thread, or immediately when a record
+    of level `ERROR` or above is emitted so that errors still hit the disk right away.
+    Pending records are flushed on interpreter exit by `logging.shutdown`.
+
+    Attributes:
+        buffer_size (int): The size (in bytes) of the log file stream buffer.
+        flush_interval (float): The interval (in seconds) between periodic flushes.
+    """
+
+    def __init__(
+        self,
+        filename: Union[str, Path],
+        backupCount: int = BACKUP_COUNT,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        buffer_size: int = BUFFER_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(
+            filename,
+            when="midnight",
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+        )
+        self._stopped = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name=f"{type(self).__name__}-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _open(self):
+        """Opens the log file with a `buffer_size` byte buffer."""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def _flush_periodically(self) -> None:
+        """Flushes the log file stream every `flush_interval` seconds until closed."""
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record: LogRecord) -> None:
+        """Writes the formatted record to the buffered stream, rotating it if due.
+
+        Unlike `StreamHandler.emit`, the stream is not flushed after each record
+        unless the record's level is `ERROR` or above.
+
+        Args:
+            record (LogRecord): The log record to be emitted.
+
+        Returns:
+            None
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Stops the periodic flusher, then flushes and closes the log file stream."""
+        self._stopped.set()
+        self._flusher.join()
+        super().close()
+
+
+# The listener running the handlers installed by the latest `configure` call.
+_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stops the current `QueueListener`, if any, and closes the handlers it runs.
+
+    Records already enqueued are handled before the handlers are closed.
+
+    Returns:
+        None
+    """
+    global _LISTENER
+    listener, _LISTENER = _LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Stops the listener once on exit, however many times logging is reconfigured.
+atexit.register(_stop_listener)
 
 
 def configure(cli: Cli) -> None:
@@ -30,8 +164,11 @@ def configure(cli: Cli) -> None:
     This function configures the logging system with a file handler that writes logs
     to a specified directory and a stream handler that outputs logs to the standard error stream.
     It uses the verbosity level specified in the settings to set the logging level and ensures
-    the log directory exists before creating the log file. The file handler logs messages to a daily
-    log file named with the current date, while the stream handler outputs log messages to stderr.
+    the log directory exists before creating the log file. The file handler logs messages to a log
+    file rotated at midnight, while the stream handler outputs log messages to stderr.
+    Both handlers run on a background `QueueListener` thread, so logging from the event loop
+    only enqueues records and never blocks on I/O. Reconfiguring stops the listener of the
+    previous call and closes its handlers.
 
     Args:
         cli (Cli): A settings object containing configuration for
@@ -40,27 +177,50 @@ def configure(cli: Cli) -> None:
     Returns:
         None
     """
+    global _LISTENER
     # Initializes logging directory.
     log_directory = cli.uc_log_directory
     log_directory.mkdir(parents=True, exist_ok=True)
-    level = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warn": logging.WARN,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }.get(cli.uc_verbosity, logging.INFO)
+    level = LEVELS.get(cli.uc_verbosity, logging.INFO)
+    # Only surfaces errors raised while logging in debug verbosity, and skips collecting
+    # thread/process information which is not part of the logging format.
+    logging.raiseExceptions = level <= logging.DEBUG
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # The format string is a constant, hence skips validating it.
+    formatter = Formatter(FORMAT, datefmt=DATE_FORMAT, validate=False)
     # Configures file logger.
-    file_handler = FileHandler(
-        filename=f"{log_directory}/{datetime.now().strftime('%Y-%m-%d')}.log",
+    file_handler = BufferedRotatingFileHandler(
+        filename=log_directory / "server.log",
         encoding="utf-8",
-        mode="a",
+        delay=True,
     )
-    file_handler.setFormatter(Formatter(FORMAT, datefmt=DATE_FORMAT))
+    file_handler.setFormatter(formatter)
     file_handler.setLevel(level)
     # Configures stream logger.
     stream_handler = StreamHandler(sys.stderr)
-    stream_handler.setFormatter(Formatter(FORMAT, datefmt=DATE_FORMAT))
+    stream_handler.setFormatter(formatter)
     stream_handler.setLevel(level)
-    # Set up logging with both file and stream handlers.
-    logging.basicConfig(handlers=(stream_handler, file_handler), level=level)
+    # Runs both file and stream handlers on a background thread.
+    records = queue.SimpleQueue()
+    listener = QueueListener(
+        records, stream_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Set up logging with the queue handler. Its formatter only merges the message
+    # arguments, as the downstream handlers apply the actual logging format.
+    queue_handler = QueueHandler(records)
+    queue_handler.setFormatter(Formatter(validate=False))
+    # NOTE:
+    # `logging.basicConfig` silently does nothing if the root logger already has handlers,
+    # hence replaces them explicitly so that reconfiguring always takes effect.
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    # Retires the previous listener only once the root logger no longer feeds its queue,
+    # so that records logged meanwhile are still handled before its handlers are closed.
+    _stop_listener()
+    _LISTENER = listener
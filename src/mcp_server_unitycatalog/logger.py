@@ -12,10 +12,11 @@ MIT License (c) 2025 Shingo OKAWA
 """
 
 import functools
+import inspect
 import time
 import uuid
 from enum import Enum
-from logging import Logger
+from logging import INFO, Logger
 from pydantic import BaseModel, Field
 from typing import Any, Callable, Optional, ParamSpec, TypeVar
 from mcp_server_unitycatalog.utils import dump_json
@@ -86,7 +87,8 @@ def observe(
     """A decorator for logging function execution details.
 
     This decorator logs function calls before execution, after execution,
-    and upon exceptions using a structured log format.
+    and upon exceptions using a structured log format. Both regular and
+    coroutine functions are supported.
 
     Args:
         by (Logger): The logger instance to be used for logging.
@@ -107,38 +109,67 @@ def observe(
     def decorator(
         func: Callable[_Params, _ReturnType],
     ) -> Callable[_Params, _ReturnType]:
-        @functools.wraps(func)
-        def wrapper(*_args: _Params.args, **_kwargs: _Params.kwargs):
-            id = str(uuid.uuid4())
-            logger = by.getChild(func.__name__)
-            before = Log(
+        logger = by.getChild(func.__name__)
+
+        def log(id: str, when: When, **fields: Any) -> None:
+            entry = Log(
                 id=id,
-                when=When.BEFORE,
+                when=when,
                 name=func.__name__,
+                logged_at=time.time_ns(),
+                **fields,
+            )
+            # NOTE:
+            # Tool results may embed already serialized JSON as `orjson.Fragment`s, which the
+            # `pydantic-core` serializer rejects, hence the entry is dumped into Python objects
+            # (leaving the fragments as they are) and serialized by `orjson` instead. Entries
+            # are only built once the logger is known to be enabled for `INFO`, and the
+            # `QueueHandler` formats records on the calling thread anyway, hence the message
+            # is serialized eagerly.
+            logger.info(
+                "%s", dump_json(entry.model_dump(by_alias=True, exclude_unset=True))
+            )
+
+        def log_before(_args: tuple, _kwargs: dict) -> str:
+            id = str(uuid.uuid4())
+            log(
+                id,
+                When.BEFORE,
                 args=_args if args is None else tuple(_args[i] for i in args),
                 kwargs=_kwargs if kwargs is None else {k: _kwargs[k] for k in kwargs},
-                logged_at=time.time_ns(),
             )
-            logger.info(dump_json(before))
+            return id
+
+        # NOTE:
+        # Building and serializing `Log` entries is expensive, hence the wrappers skip them
+        # entirely unless the records would actually be emitted.
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*_args: _Params.args, **_kwargs: _Params.kwargs):
+                if not logger.isEnabledFor(INFO):
+                    return await func(*_args, **_kwargs)
+                id = log_before(_args, _kwargs)
+                try:
+                    result = await func(*_args, **_kwargs)
+                    log(id, When.AFTER, result=result)
+                except Exception as e:
+                    log(id, When.EXCEPTION, exception=str(e))
+                    raise e
+                return result
+
+            return async_wrapper  # pyright: ignore[reportReturnType]
+
+        @functools.wraps(func)
+        def wrapper(*_args: _Params.args, **_kwargs: _Params.kwargs):
+            if not logger.isEnabledFor(INFO):
+                return func(*_args, **_kwargs)
+            id = log_before(_args, _kwargs)
             try:
                 result = func(*_args, **_kwargs)
-                after = Log(
-                    id=id,
-                    when=When.AFTER,
-                    name=func.__name__,
-                    result=result,
-                    logged_at=time.time_ns(),
-                )
-                logger.info(dump_json(after))
+                log(id, When.AFTER, result=result)
             except Exception as e:
-                exception = Log(
-                    id=id,
-                    when=When.EXCEPTION,
-                    name=func.__name__,
-                    exception=str(e),
-                    logged_at=time.time_ns(),
-                )
-                logger.info(dump_json(exception))
+                log(id, When.EXCEPTION, exception=str(e))
                 raise e
             return result
 
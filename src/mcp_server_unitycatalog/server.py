@@ -11,6 +11,7 @@ MIT License (c) 2025 Shingo OKAWA
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
@@ -23,8 +24,7 @@ from mcp_server_unitycatalog.tools import (
     Content,
     list_tools as list_ucai_tools,
     list_udf_tools,
-    dispatch_tool as dispatch_ucai_tool,
-    execute_function,
+    call_tool as call_ucai_tool,
 )
 
 
@@ -32,6 +32,24 @@ from mcp_server_unitycatalog.tools import (
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_client(endpoint: str) -> UnitycatalogFunctionClient:
+    """Returns a cached Unity Catalog function client for the given endpoint.
+
+    Constructing the client validates its configuration and opens an HTTP session,
+    hence instances are reused across `start` calls targeting the same endpoint.
+
+    Args:
+        endpoint (str): The base URL of the Unity Catalog API server.
+
+    Returns:
+        UnitycatalogFunctionClient: The client used to interact with Unity Catalog.
+    """
+    return UnitycatalogFunctionClient(
+        api_client=ApiClient(configuration=Configuration(host=endpoint))
+    )
+
+
 async def start(endpoint: str, catalog: str, schema: str) -> None:
     """Starts the MCP Unity Catalog server and initializes the API client.
 
@@ -46,27 +64,23 @@ async def start(endpoint: str, catalog: str, schema: str) -> None:
         None
     """
     server = Server("mcp-unitycatalog")
-    client = UnitycatalogFunctionClient(
-        api_client=ApiClient(configuration=Configuration(host=endpoint))
-    )
+    client = _get_client(endpoint)
 
     @server.list_tools()
     async def list_tools() -> list[Tool]:
-        return list_udf_tools(client) + list_ucai_tools()
+        tools = await list_udf_tools(client)
+        tools.extend(list_ucai_tools())
+        return tools
 
     @server.call_tool()
     async def call_tool(name: str, arguments: dict) -> list[Content]:
-        tool = dispatch_ucai_tool(name)
-        if tool is not None:
-            return tool.func(server.request_context, client, arguments)
-        else:
-            return execute_function(client, name, arguments)
+        return await call_ucai_tool(server.request_context, client, name, arguments)
 
     options = server.create_initialization_options(
         notification_options=NotificationOptions(
             resources_changed=True, tools_changed=True
         )
     )
-    LOGGER.info(f"start serving: options: {options}")
+    LOGGER.info("start serving: options: %s", options)
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, options, raise_exceptions=True)
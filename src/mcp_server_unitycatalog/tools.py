@@ -8,6 +8,7 @@ Features:
 - Creates Unity Catalog (Python) Functions.
 - Executes Unity Catalog (Python) Functions.
 - Deletes Unity Catalog Functions.
+- Executes multiple tools within a single request.
 
 License:
 MIT License (c) 2025 Shingo Okawa
@@ -15,7 +16,10 @@ MIT License (c) 2025 Shingo Okawa
 
 import asyncio
 import logging
-from typing import Callable, Optional, Union, TypeAlias
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional, Union, TypeAlias
+import orjson
 from mcp.shared.context import RequestContext
 from mcp.server.session import ServerSession
 from mcp.types import (
@@ -24,21 +28,26 @@ from mcp.types import (
     EmbeddedResource,
     Tool,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from unitycatalog.ai.core.client import UnitycatalogFunctionClient
 from unitycatalog.ai.core.utils.function_processing_utils import (
     generate_function_input_params_schema,
 )
+from unitycatalog.ai.core.base import FunctionExecutionResult
 from unitycatalog.client.models.function_info import FunctionInfo
 from mcp_server_unitycatalog.cli import get_settings as Settings
 from mcp_server_unitycatalog.logger import observe
-from mcp_server_unitycatalog.utils import create_module, dump_json
+from mcp_server_unitycatalog.utils import TtlCache, create_module, dump_json
 
 
 # The logger instance for this module.
 LOGGER = logging.getLogger(__name__)
 
 
+# The adapter serializing listed functions at once by the `pydantic-core` serializer.
+_FUNCTION_LIST_ADAPTER = TypeAdapter(list[FunctionInfo])
+
+
 class ListFunctions(BaseModel):
     """Represents a request to list Unity Catalog Functions.
 
@@ -95,20 +104,98 @@ class DeleteFunction(BaseModel):
     )
 
 
+class ToolCall(BaseModel):
+    """Represents a single tool invocation within a batch.
+
+    Attributes:
+        name (str): The name of the tool to be invoked.
+        arguments (dict): The arguments to be passed to the tool.
+    """
+
+    name: str = Field(
+        description="The name of the tool to be invoked.",
+    )
+    arguments: dict = Field(
+        default_factory=dict,
+        description="The arguments to be passed to the tool.",
+    )
+
+
+class BatchExecute(BaseModel):
+    """Represents a request to execute multiple tools within a single request.
+
+    Attributes:
+        calls (list[ToolCall]): The tool invocations to be executed.
+        max_concurrency (int): The maximum number of invocations executed concurrently.
+        timeout (Optional[float]): The timeout (in seconds) of each invocation.
+    """
+
+    calls: list[ToolCall] = Field(
+        description="The tool invocations to be executed.",
+    )
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="The maximum number of invocations executed concurrently.",
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="The timeout (in seconds) of each invocation. A timed out Unity Catalog "
+        "Function is no longer awaited, but runs to completion in the background.",
+    )
+
+
 # Represents MCP tool response content.
 Content: TypeAlias = Union[TextContent, ImageContent, EmbeddedResource]
+# Represents the (not yet serialized) results of tools, where already serialized results
+# are wrapped into `orjson.Fragment`s so that they are embedded as they are.
+Payload: TypeAlias = Union[BaseModel, list, dict, orjson.Fragment, None]
 # Represents MCP tool implementations.
 UnityCatalogAiFunction: TypeAlias = Callable[
-    [RequestContext[ServerSession], UnitycatalogFunctionClient, dict], list[Content]
+    [RequestContext[ServerSession], UnitycatalogFunctionClient, dict],
+    Awaitable[Payload],
 ]
 
 
+def _text_content(text: str) -> TextContent:
+    """Wraps the given text into an MCP text response content.
+
+    The content is constructed without validation, as `type` is a constant literal
+    and `text` is always a string produced by `dump_json`.
+
+    Args:
+        text (str): The text of the response content.
+
+    Returns:
+        TextContent: The text response content.
+    """
+    return TextContent.model_construct(type="text", text=text)
+
+
+# Defines how long (in seconds) listed UDFs are reused before querying Unity Catalog again.
+FUNCTION_LIST_TTL = 5.0
+# Defines how long (in seconds) retrieved UDF details are reused before querying Unity
+# Catalog again.
+FUNCTION_INFO_TTL = 5.0
+# Defines the maximum number of entries kept by each of the listing and UDF caches.
+CACHE_SIZE = 256
+# Cache of serialized listings keyed by the qualified name of the schema.
+_LIST_RESPONSE_CACHE: TtlCache[str, orjson.Fragment] = TtlCache(
+    FUNCTION_LIST_TTL, CACHE_SIZE
+)
+# Cache of serialized function details keyed by the qualified name of the function.
+_FUNCTION_RESPONSE_CACHE: TtlCache[str, orjson.Fragment] = TtlCache(
+    FUNCTION_INFO_TTL, CACHE_SIZE
+)
+
+
 @observe(by=LOGGER, args=[2])
-def _list_functions(
+async def _list_functions(
     context: RequestContext[ServerSession],
     client: UnitycatalogFunctionClient,
     arguments: dict,
-) -> list[Content]:
+) -> Payload:
     """Lists functions within the configured Unity Catalog catalog and schema.
 
     This function retrieves a list of functions from the Unity Catalog
@@ -120,28 +207,31 @@ def _list_functions(
         arguments (dict): A dictionary of additional arguments (currently unused).
 
     Returns:
-        list[Content]: A list of functions retrieved from Unity Catalog.
+        Payload: The serialized list of functions retrieved from Unity Catalog.
     """
-    settings, model = Settings(), ListFunctions.model_validate(arguments)
-    content = dump_json(
-        client.list_functions(
+    # NOTE:
+    # `ListFunctions` defines no fields (and ignores extra ones), hence validating the arguments
+    # can never fail nor yield anything, so no request model is built at all.
+    settings = Settings()
+    key = settings.function_name_prefix
+    content = _LIST_RESPONSE_CACHE.get(key)
+    if content is None:
+        functions = await client.list_functions_async(
             catalog=settings.uc_catalog, schema=settings.uc_schema
-        ).to_list()
-    )
-    return [
-        TextContent(
-            type="text",
-            text=content,
         )
-    ]
+        content = _LIST_RESPONSE_CACHE.put(
+            key,
+            orjson.Fragment(_FUNCTION_LIST_ADAPTER.dump_json(functions, by_alias=True)),
+        )
+    return content
 
 
 @observe(by=LOGGER, args=[2])
-def _get_function(
+async def _get_function(
     context: RequestContext[ServerSession],
     client: UnitycatalogFunctionClient,
     arguments: dict,
-) -> list[Content]:
+) -> Payload:
     """Retrieves details of a specific Unity Catalog function.
 
     This function queries the Unity Catalog for a function specified by
@@ -153,29 +243,30 @@ def _get_function(
         arguments (dict): A dictionary containing the function name.
 
     Returns:
-        list[Content]: A list containing a single TextContent object
-        with the function details in JSON format.
+        Payload: The serialized function details, or `None` if the function is missing.
     """
     settings, model = Settings(), GetFunction.model_validate(arguments)
-    content = dump_json(
-        client.get_function(
-            function_name=f"{settings.uc_catalog}.{settings.uc_schema}.{model.name}",
+    key = settings.function_name_prefix + model.name
+    content = _FUNCTION_RESPONSE_CACHE.get(key)
+    if content is None:
+        function = await client.get_function_async(function_name=key)
+        # NOTE:
+        # The client reports missing functions by returning `None`, which must not be
+        # cached, otherwise a function created meanwhile would be reported missing.
+        if function is None:
+            return None
+        content = _FUNCTION_RESPONSE_CACHE.put(
+            key, orjson.Fragment(dump_json(function))
         )
-    )
-    return [
-        TextContent(
-            type="text",
-            text=content,
-        )
-    ]
+    return content
 
 
 @observe(by=LOGGER, args=[2])
-def _create_function(
+async def _create_function(
     context: RequestContext[ServerSession],
     client: UnitycatalogFunctionClient,
     arguments: dict,
-) -> list[Content]:
+) -> Payload:
     """Creates a new Python function in Unity Catalog based on the provided script.
 
     This function extracts a specified function from the given script,
@@ -189,37 +280,32 @@ def _create_function(
             - "script" (str): The Python script containing the function definition.
 
     Returns:
-        list[Content]: A list containing the JSON response of the created function.
+        Payload: The information of the created function.
     """
     settings, model = Settings(), CreateFunction.model_validate(arguments)
     # NOTE:
     # `inspect.getsourcelines` expects the argument to be a Python object defined in an actual
     # source file, meaning it does not work for objects that exist only in memory.
-    # Hence, we provided a context manager responsible for handling temporary module creation.
+    # Hence, we provided a context manager responsible for handling temporary module creation,
+    # which registers the script source in `linecache` while the module is alive.
     with create_module(model.script) as module:
         func = getattr(module, model.name)
-        content = dump_json(
-            client.create_python_function(
-                catalog=settings.uc_catalog,
-                schema=settings.uc_schema,
-                func=func,
-            )
+        content = await client.create_python_function_async(
+            catalog=settings.uc_catalog,
+            schema=settings.uc_schema,
+            func=func,
         )
-    asyncio.run(context.session.send_tool_list_changed())
-    return [
-        TextContent(
-            type="text",
-            text=content,
-        )
-    ]
+    _invalidate_udfs()
+    await context.session.send_tool_list_changed()
+    return content
 
 
 @observe(by=LOGGER, args=[2])
-def _delete_function(
+async def _delete_function(
     context: RequestContext[ServerSession],
     client: UnitycatalogFunctionClient,
     arguments: dict,
-) -> list[Content]:
+) -> Payload:
     """Deletes a function from Unity Catalog.
 
     This function removes a registered function from the Unity Catalog,
@@ -231,97 +317,255 @@ def _delete_function(
         arguments (dict): A dictionary containing the function name to be deleted.
 
     Returns:
-        list[Content]: A list containing the deletion result as a text response.
+        Payload: The deletion result.
     """
     settings, model = Settings(), DeleteFunction.model_validate(arguments)
-    content = dump_json(
-        client.delete_function(
-            function_name=f"{settings.uc_catalog}.{settings.uc_schema}.{model.name}",
-        )
+    content = await client.delete_function_async(
+        function_name=settings.function_name_prefix + model.name,
     )
-    asyncio.run(context.session.send_tool_list_changed())
-    return [
-        TextContent(
-            type="text",
-            text=content,
-        )
-    ]
+    _invalidate_udfs()
+    await context.session.send_tool_list_changed()
+    return content
+
+
+@observe(by=LOGGER, args=[2])
+async def _batch_execute(
+    context: RequestContext[ServerSession],
+    client: UnitycatalogFunctionClient,
+    arguments: dict,
+) -> Payload:
+    """Executes multiple tools concurrently within a single request.
 
+    This function dispatches each invocation to either a Unity Catalog AI tool or
+    a registered Unity Catalog function, and collects the results into a single
+    JSON array, so that per-request overhead is paid once for the whole batch.
+    Failed invocations are reported in place rather than failing the batch.
 
-class UnityCatalogAiTool(BaseModel):
+    Args:
+        context (RequestContext[ServerSession]): The request context with session details.
+        client (UnitycatalogFunctionClient): The client used to interact with Unity Catalog.
+        arguments (dict): A dictionary containing:
+            - "calls" (list[dict]): The invocations, each with "name" and "arguments".
+            - "max_concurrency" (int): The maximum number of concurrent invocations.
+            - "timeout" (float): The timeout (in seconds) of each invocation.
+
+    Returns:
+        Payload: The list of invocation results, which is serialized at once.
+    """
+    model = BatchExecute.model_validate(arguments)
+    semaphore = asyncio.Semaphore(model.max_concurrency)
+
+    async def invoke(call: ToolCall) -> dict:
+        if call.name == "uc_batch_execute":
+            return {
+                "name": call.name,
+                "error": "nested batch execution is not supported",
+            }
+        async with semaphore:
+            try:
+                content = await asyncio.wait_for(
+                    _call_tool(context, client, call.name, call.arguments),
+                    timeout=model.timeout,
+                )
+                return {"name": call.name, "content": content}
+            except asyncio.TimeoutError:
+                return {"name": call.name, "error": f"timed out after {model.timeout}s"}
+            except Exception as e:
+                return {"name": call.name, "error": str(e)}
+
+    return await asyncio.gather(*(invoke(call) for call in model.calls))
+
+
+@dataclass(frozen=True, slots=True)
+class UnityCatalogAiTool:
     """Represents a Unity Catalog AI tool.
 
-    This dictionary structure defines the metadata and execution function for a Unity Catalog AI tool.
+    This immutable structure defines the metadata and execution function for a Unity Catalog AI tool.
 
     Attributes:
         description (str): A brief description of the tool's purpose.
-        input_schema (str): The JSON schema representing the expected input format.
+        input_schema (dict): The JSON schema representing the expected input format.
         func (UnityCatalogAiFunction): The callable function implementing the tool's behavior.
     """
 
-    description: str = Field(
-        description="A brief description of the tool's purpose.",
-    )
-    input_schema: dict = Field(
-        description="The JSON schema representing the expected input format.",
-    )
-    func: UnityCatalogAiFunction = Field(
-        description="The callable function implementing the tool's behavior.",
-    )
+    description: str
+    input_schema: dict
+    func: UnityCatalogAiFunction
+
+
+# Enumeration of available Unity Catalog AI tools, which is read-only once defined.
+UNITY_CATALOG_AI_TOOLS: Mapping[str, UnityCatalogAiTool] = MappingProxyType(
+    {
+        "uc_list_functions": UnityCatalogAiTool(
+            description="List Unity Catalog Functions within the specified parent catalog and schema. "
+            "There is no guarantee of a specific ordering of the elements in the array. "
+            f"The listing may be up to {FUNCTION_LIST_TTL:g} seconds stale.",
+            input_schema=ListFunctions.model_json_schema(),
+            func=_list_functions,
+        ),
+        "uc_get_function": UnityCatalogAiTool(
+            description="Gets a Unity Catalog Function from within a parent catalog and schema. "
+            f"The details may be up to {FUNCTION_INFO_TTL:g} seconds stale.",
+            input_schema=GetFunction.model_json_schema(),
+            func=_get_function,
+        ),
+        "uc_create_function": UnityCatalogAiTool(
+            description="Creates a Unity Catalog function. WARNING: This API is experimental and will "
+            "change in future versions.",
+            input_schema=CreateFunction.model_json_schema(),
+            func=_create_function,
+        ),
+        "uc_delete_function": UnityCatalogAiTool(
+            description="Delets a Unity Catalog function.",
+            input_schema=DeleteFunction.model_json_schema(),
+            func=_delete_function,
+        ),
+        "uc_batch_execute": UnityCatalogAiTool(
+            description="Executes multiple tools, including Unity Catalog Functions, within a single "
+            "request, and returns their results as an array in the same order.",
+            input_schema=BatchExecute.model_json_schema(),
+            func=_batch_execute,
+        ),
+    }
+)
 
 
-# Enumeration of available Unity Catalog AI tools.
-UNITY_CATALOG_AI_TOOLS: dict[str, UnityCatalogAiTool] = {
-    "uc_list_functions": UnityCatalogAiTool(
-        description="List Unity Catalog Functions within the specified parent catalog and schema. "
-        "There is no guarantee of a specific ordering of the elements in the array.",
-        input_schema=ListFunctions.model_json_schema(),
-        func=_list_functions,
-    ),
-    "uc_get_function": UnityCatalogAiTool(
-        description="Gets a Unity Catalog Function from within a parent catalog and schema.",
-        input_schema=GetFunction.model_json_schema(),
-        func=_get_function,
-    ),
-    "uc_create_function": UnityCatalogAiTool(
-        description="Creates a Unity Catalog function. WARNING: This API is experimental and will "
-        "change in future versions.",
-        input_schema=CreateFunction.model_json_schema(),
-        func=_create_function,
-    ),
-    "uc_delete_function": UnityCatalogAiTool(
-        description="Delets a Unity Catalog function.",
-        input_schema=DeleteFunction.model_json_schema(),
-        func=_delete_function,
-    ),
-}
+# Precomputed `Tool` instances of the Unity Catalog AI tools, which are immutable once
+# the registry is defined.
+_UNITY_CATALOG_AI_TOOL_LIST: tuple[Tool, ...] = tuple(
+    Tool(
+        name=name,
+        description=tool.description,
+        inputSchema=tool.input_schema,
+    )
+    for name, tool in UNITY_CATALOG_AI_TOOLS.items()
+)
 
 
 def list_tools() -> list[Tool]:
     """Returns a list of available Unity Catalog AI tools.
 
-    This function generates a list of `Tool` instances based on the `UnityCatalogAiTools`
-    enumeration, providing structured metadata for each tool.
+    This function returns the `Tool` instances precomputed from the `UNITY_CATALOG_AI_TOOLS`
+    registry, providing structured metadata for each tool.
 
     Returns:
         list[Tool]: A list of `Tool` objects, each containing:
     """
-    return [
+    return list(_UNITY_CATALOG_AI_TOOL_LIST)
+
+
+# Names of the Unity Catalog AI tools, which shadow UDFs of the same name.
+_UNITY_CATALOG_AI_TOOL_NAMES: frozenset[str] = frozenset(UNITY_CATALOG_AI_TOOLS)
+# Defines the maximum number of UDF input schemas kept cached.
+INPUT_SCHEMA_CACHE_SIZE = 512
+# Cache of UDF input schemas keyed by the function's full name, along with the last
+# update time of the function the schema was generated from.
+_INPUT_SCHEMA_CACHE: dict[Optional[str], tuple[Any, dict]] = {}
+
+
+def _get_input_schema(func: FunctionInfo) -> dict:
+    """Returns the JSON schema representing the input parameters of a UDF.
+
+    Generating the schema builds a Pydantic model for every call, hence the result
+    is memoized per function and regenerated only when the function is updated. As
+    stale entries are replaced, the cache holds at most one schema per function, and
+    the least recently generated schemas are evicted beyond `INPUT_SCHEMA_CACHE_SIZE`.
+
+    Args:
+        func (FunctionInfo): The function information retrieved from Unity Catalog.
+
+    Returns:
+        dict: The JSON schema representing the expected input format.
+    """
+    cached = _INPUT_SCHEMA_CACHE.get(func.full_name)
+    if cached is not None and cached[0] == func.updated_at:
+        return cached[1]
+    schema = generate_function_input_params_schema(
+        func
+    ).pydantic_model.model_json_schema()
+    _INPUT_SCHEMA_CACHE.pop(func.full_name, None)
+    _INPUT_SCHEMA_CACHE[func.full_name] = (func.updated_at, schema)
+    while len(_INPUT_SCHEMA_CACHE) > INPUT_SCHEMA_CACHE_SIZE:
+        del _INPUT_SCHEMA_CACHE[next(iter(_INPUT_SCHEMA_CACHE))]
+    return schema
+
+
+def _prune_input_schemas(prefix: str, functions: list[FunctionInfo]) -> None:
+    """Evicts the cached input schemas of UDFs no longer listed within a schema.
+
+    Args:
+        prefix (str): The qualified name prefix of the schema, i.e., "<catalog>.<schema>.".
+        functions (list[FunctionInfo]): The functions currently listed within the schema.
+
+    Returns:
+        None
+    """
+    listed = {func.full_name for func in functions}
+    for full_name in [
+        full_name
+        for full_name in _INPUT_SCHEMA_CACHE
+        if full_name is not None
+        and full_name.startswith(prefix)
+        and full_name not in listed
+    ]:
+        del _INPUT_SCHEMA_CACHE[full_name]
+
+
+# Cache of the `Tool` instances of listed UDFs keyed by catalog and schema.
+_UDF_TOOL_CACHE: TtlCache[tuple[str, str], tuple[Tool, ...]] = TtlCache(
+    FUNCTION_LIST_TTL, CACHE_SIZE
+)
+
+
+async def _list_udf_tools(
+    client: UnitycatalogFunctionClient, catalog: str, schema: str
+) -> tuple[Tool, ...]:
+    """Lists the UDFs within the given catalog and schema as tools, reusing recent results.
+
+    MCP clients poll `tools/list` frequently, hence the constructed tools are reused for
+    `FUNCTION_LIST_TTL` seconds, or until `_invalidate_udfs` is called when the tool
+    list is known to have changed.
+
+    Args:
+        client (UnitycatalogFunctionClient): The Unity Catalog function client.
+        catalog (str): The name of the Unity Catalog catalog.
+        schema (str): The name of the schema within the catalog.
+
+    Returns:
+        tuple[Tool, ...]: The tools of the functions registered within the catalog and schema.
+    """
+    key = (catalog, schema)
+    cached = _UDF_TOOL_CACHE.get(key)
+    if cached is not None:
+        return cached
+    functions = await client.list_functions_async(catalog=catalog, schema=schema)
+    _prune_input_schemas(f"{catalog}.{schema}.", functions)
+    tools = tuple(
         Tool(
-            name=name,
-            description=tool.description,
-            inputSchema=tool.input_schema,
+            name=func.name or "",
+            description=func.comment or "",
+            inputSchema=_get_input_schema(func),
         )
-        for name, tool in UNITY_CATALOG_AI_TOOLS.items()
-    ]
+        for func in functions
+        if func.name not in _UNITY_CATALOG_AI_TOOL_NAMES
+    )
+    return _UDF_TOOL_CACHE.put(key, tools)
 
 
-def list_udf_tools(client: UnitycatalogFunctionClient) -> list[Tool]:
+def _invalidate_udfs() -> None:
+    """Discards the cached UDF listings, e.g., when a function is created or deleted."""
+    _UDF_TOOL_CACHE.clear()
+    _LIST_RESPONSE_CACHE.clear()
+    _FUNCTION_RESPONSE_CACHE.clear()
+
+
+async def list_udf_tools(client: UnitycatalogFunctionClient) -> list[Tool]:
     """Retrieves a list of user-defined functions (UDFs) registered in Unity Catalog.
 
     This function queries Unity Catalog for all available UDFs within the specified
     catalog and schema, then constructs a list of `Tool` objects representing these
-    functions, excluding any predefined Unity Catalog AI tools.
+    functions, excluding any predefined Unity Catalog AI tools. The tools constructed
+    within the last `FUNCTION_LIST_TTL` seconds are reused as they are.
 
     Args:
         client (UnitycatalogFunctionClient): The Unity Catalog function client used
@@ -332,19 +576,7 @@ def list_udf_tools(client: UnitycatalogFunctionClient) -> list[Tool]:
         name, description, and input schema.
     """
     settings = Settings()
-    return [
-        Tool(
-            name=func.name or "",
-            description=func.comment or "",
-            inputSchema=generate_function_input_params_schema(
-                func
-            ).pydantic_model.model_json_schema(),
-        )
-        for func in client.list_functions(
-            catalog=settings.uc_catalog, schema=settings.uc_schema
-        ).to_list()
-        if func.name not in UNITY_CATALOG_AI_TOOLS
-    ]
+    return list(await _list_udf_tools(client, settings.uc_catalog, settings.uc_schema))
 
 
 def dispatch_tool(name: str) -> Optional[UnityCatalogAiTool]:
@@ -363,12 +595,31 @@ def dispatch_tool(name: str) -> Optional[UnityCatalogAiTool]:
     return UNITY_CATALOG_AI_TOOLS.get(name)
 
 
+def _run_function(
+    client: UnitycatalogFunctionClient,
+    function: FunctionInfo,
+    arguments: dict,
+) -> FunctionExecutionResult:
+    """Validates the given parameters and runs the body of the given function.
+
+    Args:
+        client (UnitycatalogFunctionClient): The Unity Catalog function client.
+        function (FunctionInfo): The function information retrieved from Unity Catalog.
+        arguments (dict): A dictionary of parameters to pass to the function.
+
+    Returns:
+        FunctionExecutionResult: The result of the function execution.
+    """
+    client.validate_input_params(function.input_params, arguments)
+    return client._execute_uc_function(function, arguments)
+
+
 @observe(by=LOGGER, args=[1, 2])
-def execute_function(
+async def execute_function(
     client: UnitycatalogFunctionClient,
     name: str,
     arguments: dict,
-) -> list[Content]:
+) -> Payload:
     """Executes a registered Unity Catalog function with the given parameters.
 
     This function invokes a function stored in Unity Catalog, passing in the
@@ -380,17 +631,69 @@ def execute_function(
         arguments (dict): A dictionary of parameters to pass to the function.
 
     Returns:
-        list[Content]: The output of the function execution, wrapped in a
-        list of `Content` objects.
+        Payload: The output of the function execution.
+
+    Raises:
+        ValueError: If the function is not registered in Unity Catalog.
     """
     settings = Settings()
-    content = client.execute_function(
-        function_name=f"{settings.uc_catalog}.{settings.uc_schema}.{name}",
-        parameters=arguments,
-    ).to_json()
+    function_name = settings.function_name_prefix + name
+    # NOTE:
+    # `client.execute_function` holds the client's (non-reentrant) `threading.Lock` while running
+    # the syncified `get_function`, whose nested `run_until_complete` steps the other tasks of the
+    # loop, so concurrent invocations would deadlock on that lock. Instead, the function is looked
+    # up through the client's event-loop-bound session, and only its body, which runs in-process,
+    # is offloaded to a worker thread so that the event loop keeps serving other requests.
+    function = await client.get_function_async(function_name=function_name)
+    if function is None:
+        raise ValueError(f"Function {function_name} is not registered.")
+    result = await asyncio.to_thread(_run_function, client, function, arguments)
+    # NOTE:
+    # Mirrors `FunctionExecutionResult.to_json`, which omits unset fields.
+    return {k: v for k, v in vars(result).items() if v is not None}
+
+
+async def _call_tool(
+    context: RequestContext[ServerSession],
+    client: UnitycatalogFunctionClient,
+    name: str,
+    arguments: dict,
+) -> Payload:
+    """Invokes a Unity Catalog AI tool or a registered Unity Catalog function by name.
+
+    Args:
+        context (RequestContext[ServerSession]): The request context with session details.
+        client (UnitycatalogFunctionClient): The Unity Catalog function client.
+        name (str): The name of the tool or function (not fully qualified) to invoke.
+        arguments (dict): A dictionary of parameters to pass to the tool or function.
+
+    Returns:
+        Payload: The output of the invocation, which is not serialized yet.
+    """
+    tool = dispatch_tool(name)
+    if tool is not None:
+        return await tool.func(context, client, arguments)
+    else:
+        return await execute_function(client, name, arguments)
+
+
+async def call_tool(
+    context: RequestContext[ServerSession],
+    client: UnitycatalogFunctionClient,
+    name: str,
+    arguments: dict,
+) -> list[Content]:
+    """Invokes a Unity Catalog AI tool or a registered Unity Catalog function by name.
+
+    Args:
+        context (RequestContext[ServerSession]): The request context with session details.
+        client (UnitycatalogFunctionClient): The Unity Catalog function client.
+        name (str): The name of the tool or function (not fully qualified) to invoke.
+        arguments (dict): A dictionary of parameters to pass to the tool or function.
+
+    Returns:
+        list[Content]: The output of the invocation, wrapped in a list of `Content` objects.
+    """
     return [
-        TextContent(
-            type="text",
-            text=content,
-        )
+        _text_content(dump_json(await _call_tool(context, client, name, arguments)))
     ]
@@ -3,59 +3,47 @@
 This module provides helper functions.
 
 Features:
-- Safely applying functions to multiple Optional values (`_fmap`).
 - Serializing Pydantic models, lists, and dictionaries to JSON (`dump_json`).
-- Dynamically creating and loading temporary Python modules (`create_module`).
+- Dynamically creating in-memory Python modules (`create_module`).
+- Caching values for a limited time with a bounded size (`TtlCache`).
 
 License:
 MIT License (c) 2025 Shingo Okawa
 """
 
-import json
+import hashlib
+import itertools
+import linecache
+import sys
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from importlib.util import spec_from_file_location, module_from_spec
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Any, Callable, Iterator, Optional, TypeVar, Union
-from types import ModuleType
+from functools import lru_cache
+from typing import Generic, Hashable, Iterator, Optional, TypeVar, Union
+from types import CodeType, ModuleType
+import orjson
 from pydantic import BaseModel
-from pydantic.json import pydantic_encoder
+from pydantic_core import to_jsonable_python
 
 
-# _ReturnType represents the return type of the function passed to `_fmap`.
-_ReturnType = TypeVar("_ReturnType")
+# _Key represents the type of the keys of a `TtlCache`.
+_Key = TypeVar("_Key", bound=Hashable)
+# _Value represents the type of the values of a `TtlCache`.
+_Value = TypeVar("_Value")
 
 
-def _fmap(
-    func: Callable[..., Optional[_ReturnType]], *maybe_nones: Optional[Any]
-) -> Optional[_ReturnType]:
-    """Applies a function to multiple Optional values, flattening the result.
-
-    If any input is None, returns None. Otherwise, applies `func` to the
-    unwrapped values and returns its result.
-
-    Args:
-        func: A function that takes multiple arguments of potentially different types
-              and returns an Optional[R].
-        *maybe_nones: A variable number of Optional values of different types.
-
-    Returns:
-        An Optional[_ReturnType] resulting from applying `func` to the unwrapped values,
-        or None if any input is None.
-    """
-    if any(maybe is None for maybe in maybe_nones):
-        return None
-    return func(*maybe_nones)
-
-
-def dump_json(maybe_model: Union[BaseModel, list, dict, None]) -> str:
+def dump_json(maybe_model: Union[BaseModel, list, dict, orjson.Fragment, None]) -> str:
     """Serializes a Pydantic model, list, or dictionary to a JSON string.
 
     This function ensures proper serialization using Pydantic's encoding utilities,
-    handling both single model instances and lists/dicts of models.
+    handling both single model instances and lists/dicts of models. Lists and dicts
+    are serialized by `orjson`, while models use their own (native) serializer.
+    Already serialized JSON wrapped into an `orjson.Fragment` is embedded as it is.
 
     Args:
-        maybe_model (Union[BaseModel, list, dict, None]): The object to serialize.
+        maybe_model (Union[BaseModel, list, dict, orjson.Fragment, None]): The object
+            to serialize.
 
     Returns:
         str: A JSON string representation of the input, or an empty string if None
@@ -63,18 +51,58 @@ def dump_json(maybe_model: Union[BaseModel, list, dict, None]) -> str:
     """
     if maybe_model is None:
         return ""
-    elif isinstance(maybe_model, list) or isinstance(maybe_model, dict):
-        return json.dumps(maybe_model, default=pydantic_encoder, separators=(",", ":"))
+    elif isinstance(maybe_model, (list, dict, orjson.Fragment)):
+        return orjson.dumps(
+            maybe_model, default=to_jsonable_python, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
     else:
         return maybe_model.model_dump_json(by_alias=True, exclude_unset=True)
 
 
+def _module_name(script: str) -> str:
+    """Derives a module name specific to the given script.
+
+    Args:
+        script (str): The Python script to be dynamically loaded.
+
+    Returns:
+        str: The module name derived from the digest of the script.
+    """
+    return f"ucai_{hashlib.blake2b(script.encode(), digest_size=16).hexdigest()}"
+
+
+@lru_cache(maxsize=256)
+def _compile_script(script: str) -> CodeType:
+    """Compiles the given script, caching the resulting code object.
+
+    The code object is named after `_module_name`, so identical scripts share both
+    the compiled code and the pseudo file name their source is registered under.
+
+    Args:
+        script (str): The Python script to be compiled.
+
+    Returns:
+        CodeType: The compiled code object.
+    """
+    return compile(script, f"<{_module_name(script)}>", "exec")
+
+
+# Counter distinguishing the modules created concurrently from identical scripts.
+_MODULE_COUNTER = itertools.count()
+# Number of alive modules sharing each pseudo file name registered in `linecache`.
+_LINECACHE_REFS: dict[str, int] = {}
+# Lock guarding `_LINECACHE_REFS` along with the `linecache` entries it accounts for.
+_LINECACHE_LOCK = threading.Lock()
+
+
 @contextmanager
-def create_module(script: str) -> Iterator[Optional[ModuleType]]:
-    """Creates a temporary Python module from a given script string.
+def create_module(script: str) -> Iterator[ModuleType]:
+    """Creates a temporary in-memory Python module from a given script string.
 
-    This context manager writes the provided script to a temporary file,
-    loads it as a module, and yields it for use.
+    This context manager compiles the provided script, executes it within a fresh
+    module namespace, and yields the module for use. The module is registered in
+    `sys.modules` and its source in `linecache` while the context is active, so that
+    `inspect.getsource` works for the objects defined in it.
 
     Args:
         script (str): The Python script to be dynamically loaded.
@@ -82,11 +110,95 @@ def create_module(script: str) -> Iterator[Optional[ModuleType]]:
     Yields:
         ModuleType: The loaded temporary module.
     """
-    with NamedTemporaryFile(suffix=".py") as tmp:
-        tmp.write(script.encode())
-        tmp.flush()
-        spec = spec_from_file_location(Path(tmp.name).stem, tmp.name)
-        module = _fmap(module_from_spec, spec)
-        loader = _fmap(lambda spec: spec.loader, spec)
-        _ = _fmap(lambda loader, module: loader.exec_module(module), loader, module)
+    code = _compile_script(script)
+    # NOTE:
+    # The pseudo file name is `<{module name}>`, hence the module name is recovered from the
+    # cached code object instead of hashing the script again on every call. Identical scripts
+    # may be loaded concurrently (e.g., by batched tool calls), hence each module is suffixed
+    # with a counter, while the shared `linecache` entry is reference counted, so that exiting
+    # one context does not unregister what the others are still using.
+    filename = code.co_filename
+    name = f"{filename[1:-1]}_{next(_MODULE_COUNTER)}"
+    module = ModuleType(name)
+    module.__file__ = filename
+    with _LINECACHE_LOCK:
+        _LINECACHE_REFS[filename] = _LINECACHE_REFS.get(filename, 0) + 1
+        linecache.cache[filename] = (
+            len(script),
+            None,
+            script.splitlines(keepends=True),
+            filename,
+        )
+    sys.modules[name] = module
+    try:
+        exec(code, module.__dict__)
         yield module
+    finally:
+        sys.modules.pop(name, None)
+        with _LINECACHE_LOCK:
+            _LINECACHE_REFS[filename] -= 1
+            if not _LINECACHE_REFS[filename]:
+                del _LINECACHE_REFS[filename]
+                linecache.cache.pop(filename, None)
+
+
+class TtlCache(Generic[_Key, _Value]):
+    """A cache whose entries expire after a fixed time, holding a bounded number of them.
+
+    Entries are kept in insertion order, which is also their order of expiry. Expired
+    entries are dropped when they are looked up and from the oldest end whenever an entry
+    is stored, and the oldest entries are evicted once the cache exceeds `maxsize`.
+
+    Attributes:
+        ttl (float): The time (in seconds) the entries are kept for.
+        maxsize (int): The maximum number of entries kept.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_Key, tuple[float, _Value]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _Key) -> Optional[_Value]:
+        """Looks up the value stored for the given key within the last `ttl` seconds.
+
+        Args:
+            key (_Key): The key of the entry.
+
+        Returns:
+            Optional[_Value]: The value if the entry is still fresh, otherwise `None`.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def put(self, key: _Key, value: _Value) -> _Value:
+        """Stores the value for the given key, dropping expired and excess entries.
+
+        Args:
+            key (_Key): The key of the entry.
+            value (_Value): The value to be stored.
+
+        Returns:
+            _Value: The given value.
+        """
+        now = time.monotonic()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if len(self._entries) <= self.maxsize and now - oldest[0] < self.ttl:
+                break
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Discards all the entries."""
+        self._entries.clear()
@@ -11,6 +11,9 @@ MIT License (c) 2025 Shingo OKAWA
 import os
 import random
 import string
+import sys
+from typing import Iterator
+from unittest.mock import patch
 import pytest
 from mcp_server_unitycatalog.cli import Cli, get_settings
 
@@ -82,6 +85,34 @@ def schema():
     return _random_alpha_num(10)
 
 
+@pytest.fixture
+def argv(server: str, catalog: str, schema: str) -> Iterator[list[str]]:
+    """Fixture that patches `sys.argv` with the command line pointing at the test server.
+
+    This fixture builds the command line from the `server`, `catalog`, and `schema`
+    fixtures, so that tests requesting them receive the same values as the settings.
+
+    Args:
+        server (str): The Unity Catalog server URL.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Yields:
+        list[str]: The command line arguments patched into `sys.argv`.
+    """
+    argv = [
+        "mcp-server-unitycatalog",
+        "--uc_server",
+        server,
+        "--uc_catalog",
+        catalog,
+        "--uc_schema",
+        schema,
+    ]
+    with patch.object(sys, "argv", argv):
+        yield argv
+
+
 @pytest.fixture(autouse=True)
 def setup_function():
     """Automatically clears the settings cache before each test.
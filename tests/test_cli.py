@@ -19,7 +19,7 @@ import sys
 import pytest
 from pydantic import ValidationError
 from unittest.mock import patch
-from mcp_server_unitycatalog.cli import get_settings
+from mcp_server_unitycatalog.cli import Cli, get_settings
 
 
 def test_cache(server: str, catalog: str, schema: str) -> None:
@@ -97,3 +97,55 @@ def test_required_arguments(server: str, catalog: str, schema: str) -> None:
         with pytest.raises(ValidationError) as exc_info:
             settings = get_settings()
         assert "Field required" in str(exc_info.value)
+
+
+def test_function_name_prefix(server: str, catalog: str, schema: str) -> None:
+    """Tests that the function name prefix qualifies names with the catalog and schema.
+
+    Args:
+        server (str): The Unity Catalog server URL.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - The prefix is in the format of "<catalog>.<schema>.".
+        - The prefix is not exposed as a configuration field.
+    """
+    argv = [
+        "mcp-server-unitycatalog",
+        "--uc_server",
+        server,
+        "--uc_catalog",
+        catalog,
+        "--uc_schema",
+        schema,
+    ]
+    with patch.object(sys, "argv", argv):
+        settings = get_settings()
+        assert settings.function_name_prefix == f"{catalog}.{schema}."
+        assert "function_name_prefix" not in settings.model_dump()
+
+
+def test_from_env(
+    monkeypatch: pytest.MonkeyPatch, server: str, catalog: str, schema: str
+) -> None:
+    """Tests that `Cli.from_env` loads settings without parsing CLI arguments.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The monkeypatch fixture provided by pytest.
+        server (str): The Unity Catalog server URL.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - Settings are loaded from environment variables.
+        - Unknown CLI arguments are ignored rather than rejected.
+    """
+    monkeypatch.setenv("UC_SERVER", server)
+    monkeypatch.setenv("UC_CATALOG", catalog)
+    monkeypatch.setenv("UC_SCHEMA", schema)
+    with patch.object(sys, "argv", ["mcp-server-unitycatalog", "--unknown"]):
+        settings = Cli.from_env()
+        assert settings.uc_server == server
+        assert settings.uc_catalog == catalog
+        assert settings.uc_schema == schema
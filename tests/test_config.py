@@ -0,0 +1,134 @@
+"""Tests for the logging configuration in the MCP Unity Catalog project.
+
+This module contains unit tests for verifying that the logging handlers set up
+by `mcp_server_unitycatalog.config` behave as expected.
+
+The tests ensure that:
+- File log records are buffered rather than flushed on every write.
+- Records of level `ERROR` or above are flushed immediately.
+- Reconfiguring logging replaces the previously installed handlers.
+- Reconfiguring logging stops the previous listener and closes its handlers.
+
+License:
+MIT License (c) 2025 Shingo OKAWA
+"""
+
+import logging
+import threading
+from logging.handlers import QueueHandler
+from pathlib import Path
+import pytest
+from mcp_server_unitycatalog import config
+from mcp_server_unitycatalog.cli import Cli
+from mcp_server_unitycatalog.config import BufferedRotatingFileHandler, configure
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    """Creates a log record with the given level and message.
+
+    Args:
+        level (int): The logging level of the record.
+        message (str): The message of the record.
+
+    Returns:
+        logging.LogRecord: The created log record.
+    """
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+def test_buffered_file_handler(tmp_path: Path) -> None:
+    """Tests that `BufferedRotatingFileHandler` defers writes until it is flushed.
+
+    Args:
+        tmp_path (Path): A temporary directory provided by pytest.
+
+    Asserts:
+        - Records below `ERROR` are not written to disk before a flush.
+        - Records of level `ERROR` force the buffered records to disk.
+    """
+    log_file = tmp_path / "test.log"
+    handler = BufferedRotatingFileHandler(str(log_file), flush_interval=3600)
+    try:
+        handler.handle(_record(logging.INFO, "buffered"))
+        assert log_file.read_text() == ""
+        handler.handle(_record(logging.ERROR, "flushed"))
+        assert log_file.read_text() == "buffered\nflushed\n"
+    finally:
+        handler.close()
+
+
+@pytest.fixture
+def root():
+    """Fixture that restores the logging configuration altered by `configure`.
+
+    Yields:
+        logging.Logger: The root logger.
+    """
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    flags = (
+        logging.raiseExceptions,
+        logging.logThreads,
+        logging.logProcesses,
+        logging.logMultiprocessing,
+    )
+    try:
+        yield root
+    finally:
+        config._stop_listener()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+        (
+            logging.raiseExceptions,
+            logging.logThreads,
+            logging.logProcesses,
+            logging.logMultiprocessing,
+        ) = flags
+
+
+def _logging_threads() -> list[threading.Thread]:
+    """Returns the live threads run by the logging configuration.
+
+    Returns:
+        list[threading.Thread]: The `QueueListener` and log file flusher threads.
+    """
+    # NOTE:
+    # `QueueListener` threads are unnamed, hence recognized by their `_monitor` target.
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.endswith(("-flusher", "(_monitor)"))
+    ]
+
+
+def test_configure(root: logging.Logger, tmp_path: Path) -> None:
+    """Tests that `configure` replaces the root handlers each time it is called.
+
+    Args:
+        root (logging.Logger): The root logger.
+        tmp_path (Path): A temporary directory provided by pytest.
+
+    Asserts:
+        - The root logger ends up with a single `QueueHandler`.
+        - The root logger level follows the latest verbosity.
+        - Only the latest listener and its handlers remain alive.
+    """
+    threads = set(_logging_threads())
+    for verbosity in ("info", "debug", "info", "debug"):
+        configure(
+            Cli.model_construct(uc_log_directory=tmp_path, uc_verbosity=verbosity)
+        )
+        logging.getLogger(__name__).warning("configured")
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], QueueHandler)
+    assert root.level == logging.DEBUG
+    assert len(set(_logging_threads()) - threads) == 2
+    file_handlers = [
+        handler
+        for handler in config._LISTENER.handlers
+        if isinstance(handler, BufferedRotatingFileHandler)
+    ]
+    assert len(file_handlers) == 1
+    config._stop_listener()
+    assert set(_logging_threads()) == threads
+    assert file_handlers[0].stream is None
@@ -0,0 +1,110 @@
+"""Tests for the logging decorator in the MCP Unity Catalog project.
+
+This module contains unit tests for verifying that the `observe` decorator
+logs function calls only when the logger is enabled for the `INFO` level.
+
+License:
+MIT License (c) 2025 Shingo OKAWA
+"""
+
+import asyncio
+import logging
+import orjson
+import pytest
+from mcp_server_unitycatalog.logger import observe
+
+
+# The logger instance for this module.
+LOGGER = logging.getLogger(__name__)
+
+
+@observe(by=LOGGER)
+def _add(lhs: int, rhs: int) -> int:
+    """Adds two integers.
+
+    Args:
+        lhs (int): The left-hand side operand.
+        rhs (int): The right-hand side operand.
+
+    Returns:
+        int: The sum of the operands.
+    """
+    return lhs + rhs
+
+
+@observe(by=LOGGER)
+async def _async_add(lhs: int, rhs: int) -> int:
+    """Adds two integers asynchronously.
+
+    Args:
+        lhs (int): The left-hand side operand.
+        rhs (int): The right-hand side operand.
+
+    Returns:
+        int: The sum of the operands.
+    """
+    return lhs + rhs
+
+
+@observe(by=LOGGER)
+def _fragment(text: str) -> orjson.Fragment:
+    """Wraps the given JSON text into a fragment.
+
+    Args:
+        text (str): The serialized JSON.
+
+    Returns:
+        orjson.Fragment: The JSON fragment.
+    """
+    return orjson.Fragment(text)
+
+
+def test_observe(caplog: pytest.LogCaptureFixture) -> None:
+    """Tests that `observe` logs calls only when `INFO` is enabled.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): The log capturing fixture provided by pytest.
+
+    Asserts:
+        - No records are emitted when the logger level is above `INFO`.
+        - Both `before` and `after` records are emitted at the `INFO` level.
+    """
+    with caplog.at_level(logging.WARNING, logger=__name__):
+        assert _add(1, 2) == 3
+        assert caplog.records == []
+    with caplog.at_level(logging.INFO, logger=__name__):
+        assert _add(1, 2) == 3
+        assert [r.name for r in caplog.records] == [f"{__name__}._add"] * 2
+        assert '"when":"before"' in caplog.records[0].getMessage()
+        assert '"when":"after"' in caplog.records[1].getMessage()
+
+
+def test_observe_coroutine(caplog: pytest.LogCaptureFixture) -> None:
+    """Tests that `observe` logs the awaited result of coroutine functions.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): The log capturing fixture provided by pytest.
+
+    Asserts:
+        - The decorated function remains a coroutine function.
+        - The `after` record contains the awaited result rather than a coroutine.
+    """
+    assert asyncio.iscoroutinefunction(_async_add)
+    with caplog.at_level(logging.INFO, logger=__name__):
+        assert asyncio.run(_async_add(1, 2)) == 3
+        assert [r.name for r in caplog.records] == [f"{__name__}._async_add"] * 2
+        assert '"result":3' in caplog.records[1].getMessage()
+
+
+def test_observe_fragment(caplog: pytest.LogCaptureFixture) -> None:
+    """Tests that `observe` logs results embedding already serialized JSON.
+
+    Args:
+        caplog (pytest.LogCaptureFixture): The log capturing fixture provided by pytest.
+
+    Asserts:
+        - The `after` record embeds the fragment as it is.
+    """
+    with caplog.at_level(logging.INFO, logger=__name__):
+        _fragment('{"value":1}')
+        assert '"result":{"value":1}' in caplog.records[1].getMessage()
@@ -0,0 +1,337 @@
+"""Tests for the Unity Catalog AI tools in the MCP Unity Catalog project.
+
+This module contains unit tests for verifying the helpers used by the tools
+exposed by the MCP Unity Catalog server.
+
+The tests ensure that:
+- UDF input schemas are memoized until the function is updated.
+- UDF input schemas are bounded and evicted once functions are no longer listed.
+- Batched tool invocations are executed and reported in order.
+- Batched function invocations do not deadlock the client.
+- UDF listings are reused until they are invalidated.
+- Listed functions are serialized as a JSON array of function information.
+- Listings and function details are served from the cache until invalidated.
+- Missing functions are not cached.
+
+License:
+MIT License (c) 2025 Shingo OKAWA
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+from unitycatalog.ai.core.client import UnitycatalogFunctionClient
+from unitycatalog.ai.core.paged_list import PagedList
+from unitycatalog.client import ApiClient, Configuration
+from unitycatalog.client.models import (
+    ColumnTypeName,
+    FunctionInfo,
+    FunctionParameterInfo,
+    FunctionParameterInfos,
+)
+from mcp_server_unitycatalog.utils import dump_json
+from mcp_server_unitycatalog import tools
+from mcp_server_unitycatalog.tools import (
+    _INPUT_SCHEMA_CACHE,
+    _get_input_schema,
+    _prune_input_schemas,
+    _invalidate_udfs,
+    call_tool,
+    list_udf_tools,
+)
+
+
+def _function_info(catalog: str, schema: str, updated_at: int) -> FunctionInfo:
+    """Creates a `FunctionInfo` of a UDF incrementing a single `bigint` parameter.
+
+    Args:
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+        updated_at (int): The last update time of the function.
+
+    Returns:
+        FunctionInfo: The created function information.
+    """
+    return FunctionInfo(
+        name="increment",
+        full_name=f"{catalog}.{schema}.increment",
+        updated_at=updated_at,
+        data_type=ColumnTypeName.LONG,
+        routine_body="EXTERNAL",
+        routine_definition="return x + 1",
+        input_params=FunctionParameterInfos(
+            parameters=[
+                FunctionParameterInfo(
+                    name="x",
+                    type_name=ColumnTypeName.LONG,
+                    type_text="bigint",
+                    type_json='{"name":"x","type":"long","nullable":false,"metadata":{}}',
+                    position=0,
+                )
+            ]
+        ),
+    )
+
+
+def test_input_schema_cache(catalog: str, schema: str) -> None:
+    """Tests that UDF input schemas are cached per function version.
+
+    Args:
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - The same schema object is returned for an unchanged function.
+        - A new schema is generated once the function is updated.
+        - The stale schema is replaced rather than kept alongside.
+    """
+    lhs = _get_input_schema(_function_info(catalog, schema, updated_at=0))
+    rhs = _get_input_schema(_function_info(catalog, schema, updated_at=0))
+    assert lhs is rhs
+    assert "x" in lhs["properties"]
+    updated = _get_input_schema(_function_info(catalog, schema, updated_at=1))
+    assert updated is not lhs
+    assert updated == lhs
+    assert _INPUT_SCHEMA_CACHE[f"{catalog}.{schema}.increment"] == (1, updated)
+
+
+def test_input_schema_cache_eviction(catalog: str, schema: str) -> None:
+    """Tests that UDF input schemas are bounded and evicted once no longer listed.
+
+    Args:
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - The least recently generated schemas are evicted beyond the cache size.
+        - Schemas of functions no longer listed within the schema are evicted.
+        - Schemas of functions within other schemas are kept.
+    """
+    with patch.dict(_INPUT_SCHEMA_CACHE, clear=True):
+        with patch.object(tools, "INPUT_SCHEMA_CACHE_SIZE", 1):
+            _get_input_schema(_function_info(f"{catalog}_0", schema, updated_at=0))
+            _get_input_schema(_function_info(f"{catalog}_1", schema, updated_at=0))
+        assert list(_INPUT_SCHEMA_CACHE) == [f"{catalog}_1.{schema}.increment"]
+        function = _function_info(catalog, schema, updated_at=0)
+        _get_input_schema(function)
+        _prune_input_schemas(f"{catalog}.{schema}.", [function])
+        assert f"{catalog}.{schema}.increment" in _INPUT_SCHEMA_CACHE
+        _prune_input_schemas(f"{catalog}.{schema}.", [])
+        assert list(_INPUT_SCHEMA_CACHE) == [f"{catalog}_1.{schema}.increment"]
+
+
+def test_batch_execute(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that `uc_batch_execute` runs each invocation and reports it in order.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - Successful invocations report the content returned by the tool.
+        - Failed and nested batch invocations are reported as errors in place.
+    """
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.list_functions_async.return_value = PagedList([], None)
+    client.get_function_async.side_effect = RuntimeError("not found")
+    arguments = {
+        "calls": [
+            {"name": "uc_list_functions"},
+            {"name": "uc_get_function", "arguments": {"name": "missing"}},
+            {"name": "uc_batch_execute", "arguments": {"calls": []}},
+        ]
+    }
+    contents = asyncio.run(call_tool(None, client, "uc_batch_execute", arguments))
+    results = json.loads(contents[0].text)
+    assert [result["name"] for result in results] == [
+        call["name"] for call in arguments["calls"]
+    ]
+    assert results[0]["content"] == []
+    assert results[1]["error"] == "not found"
+    assert "nested" in results[2]["error"]
+    client.list_functions_async.assert_awaited_once_with(catalog=catalog, schema=schema)
+
+
+def test_batch_execute_functions(
+    argv: list[str], server: str, catalog: str, schema: str
+) -> None:
+    """Tests that batched Unity Catalog Function invocations do not deadlock the client.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        server (str): The Unity Catalog server URL.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - The batch completes rather than blocking on the client's lock.
+        - Each invocation reports the result of its own arguments.
+    """
+    function = _function_info(catalog, schema, updated_at=0)
+
+    async def get_function_async(function_name: str, timeout=None) -> FunctionInfo:
+        await asyncio.sleep(0)
+        return function
+
+    async def execute() -> list:
+        api_client = ApiClient(configuration=Configuration(host=server))
+        client = UnitycatalogFunctionClient(api_client=api_client)
+        arguments = {
+            "calls": [
+                {"name": "increment", "arguments": {"x": 1}},
+                {"name": "increment", "arguments": {"x": 2}},
+            ]
+        }
+        try:
+            with patch.object(client, "get_function_async", get_function_async):
+                return await call_tool(None, client, "uc_batch_execute", arguments)
+        finally:
+            await api_client.close()
+
+    # NOTE:
+    # A deadlock blocks the thread within a `threading.Lock`, which cannot be interrupted,
+    # hence the batch is run in a daemon thread joined with a timeout.
+    contents = []
+    thread = threading.Thread(
+        target=lambda: contents.extend(asyncio.run(execute())), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    results = json.loads(contents[0].text)
+    assert [result["content"]["value"] for result in results] == ["2", "3"]
+
+
+def test_batch_execute_timeout(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that batched Unity Catalog Function invocations are subject to the timeout.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - Function bodies run off the event loop, so the timeout can interrupt the wait.
+        - Timed out invocations are reported as errors in place.
+    """
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.get_function_async.return_value = _function_info(
+        catalog, schema, updated_at=0
+    )
+    released = threading.Event()
+    arguments = {
+        "calls": [{"name": "increment", "arguments": {"x": 1}}],
+        "timeout": 0.1,
+    }
+    try:
+        with patch.object(tools, "_run_function", lambda *_: released.wait(10)):
+            contents = asyncio.run(
+                asyncio.wait_for(
+                    call_tool(None, client, "uc_batch_execute", arguments), 5
+                )
+            )
+    finally:
+        released.set()
+    assert json.loads(contents[0].text) == [
+        {"name": "increment", "error": "timed out after 0.1s"}
+    ]
+
+
+def test_list_udf_tools_cache(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that UDF listings are reused until they are invalidated.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - Consecutive listings query Unity Catalog only once and share the tools.
+        - Listings query Unity Catalog again once invalidated.
+    """
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.list_functions_async.return_value = PagedList(
+        [_function_info(catalog, schema, updated_at=0)], None
+    )
+    tools = asyncio.run(list_udf_tools(client))
+    assert [tool.name for tool in tools] == ["increment"]
+    assert asyncio.run(list_udf_tools(client))[0] is tools[0]
+    assert client.list_functions_async.await_count == 1
+    _invalidate_udfs()
+    assert [tool.name for tool in asyncio.run(list_udf_tools(client))] == ["increment"]
+    assert client.list_functions_async.await_count == 2
+
+
+def test_list_functions(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that listed functions are serialized as a JSON array of function information.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - The listing is serialized identically to `dump_json`.
+    """
+    functions = [_function_info(catalog, schema, updated_at=0)]
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.list_functions_async.return_value = PagedList(functions, None)
+    contents = asyncio.run(call_tool(None, client, "uc_list_functions", {}))
+    assert json.loads(contents[0].text) == json.loads(dump_json(functions))
+
+
+def test_response_cache(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that listings and function details are served from the cache until invalidated.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - Repeated listings and retrievals query Unity Catalog only once.
+        - Cached responses are identical to the original ones.
+        - Responses are retrieved again once invalidated.
+    """
+    function = _function_info(catalog, schema, updated_at=0)
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.list_functions_async.return_value = PagedList([function], None)
+    client.get_function_async.return_value = function
+    calls = [("uc_list_functions", {}), ("uc_get_function", {"name": "increment"})]
+    for name, arguments in calls:
+        lhs = asyncio.run(call_tool(None, client, name, arguments))
+        rhs = asyncio.run(call_tool(None, client, name, arguments))
+        assert lhs[0].text == rhs[0].text
+    assert client.list_functions_async.await_count == 1
+    client.get_function_async.assert_awaited_once_with(
+        function_name=f"{catalog}.{schema}.increment"
+    )
+    _invalidate_udfs()
+    for name, arguments in calls:
+        asyncio.run(call_tool(None, client, name, arguments))
+    assert client.list_functions_async.await_count == 2
+    assert client.get_function_async.await_count == 2
+
+
+def test_response_cache_missing(argv: list[str], catalog: str, schema: str) -> None:
+    """Tests that missing functions are not cached.
+
+    Args:
+        argv (list[str]): The command line arguments patched into `sys.argv`.
+        catalog (str): The catalog name within Unity Catalog.
+        schema (str): The schema name within the catalog.
+
+    Asserts:
+        - A missing function is reported with an empty response.
+        - A function created afterwards is retrieved without invalidation.
+    """
+    function = _function_info(catalog, schema, updated_at=0)
+    client = MagicMock(spec=UnitycatalogFunctionClient)
+    client.get_function_async.side_effect = [None, function]
+    arguments = {"name": "increment"}
+    contents = asyncio.run(call_tool(None, client, "uc_get_function", arguments))
+    assert contents[0].text == ""
+    contents = asyncio.run(call_tool(None, client, "uc_get_function", arguments))
+    assert contents[0].text == dump_json(function)
@@ -0,0 +1,130 @@
+"""Tests for the utility functions in the MCP Unity Catalog project.
+
+This module contains unit tests for verifying the helper functions
+provided by `mcp_server_unitycatalog.utils`.
+
+The tests ensure that:
+- Models, lists, and dictionaries are serialized to compact JSON.
+- Dynamically created modules expose the functions defined in the script.
+- The source of those functions can be inspected while the module is alive.
+- Identical scripts are compiled only once, and can be loaded at the same time.
+- Cached values expire after their time to live and are bounded in number.
+
+License:
+MIT License (c) 2025 Shingo OKAWA
+"""
+
+import inspect
+import linecache
+import sys
+from unittest.mock import patch
+import orjson
+from mcp.types import TextContent
+from mcp_server_unitycatalog.utils import (
+    TtlCache,
+    _compile_script,
+    create_module,
+    dump_json,
+)
+
+
+# Defines the script used to create temporary modules.
+SCRIPT = '''def add(lhs: int, rhs: int) -> int:
+    """Adds two integers."""
+    return lhs + rhs
+'''
+
+
+def test_create_module() -> None:
+    """Tests that `create_module` loads the script into an inspectable module.
+
+    Asserts:
+        - Functions defined in the script can be called.
+        - `inspect.getsource` returns the script while the module is alive.
+        - The module is unregistered from `sys.modules` once the context exits.
+    """
+    with create_module(SCRIPT) as module:
+        assert module.add(1, 2) == 3
+        assert inspect.getsource(module.add) == SCRIPT
+        assert sys.modules[module.__name__] is module
+    assert module.__name__ not in sys.modules
+    with create_module(SCRIPT) as other:
+        assert other is not module
+        assert other.add(2, 3) == 5
+
+
+def test_create_module_compile_cache() -> None:
+    """Tests that `create_module` compiles identical scripts only once.
+
+    Asserts:
+        - Creating a module from an already compiled script hits the compile cache.
+        - Modules created from identical scripts share the pseudo file name.
+    """
+    with create_module(SCRIPT) as module:
+        filename = module.__file__
+    hits = _compile_script.cache_info().hits
+    with create_module(SCRIPT) as module:
+        assert module.__file__ == filename
+    assert _compile_script.cache_info().hits == hits + 1
+
+
+def test_create_module_overlapping() -> None:
+    """Tests that modules created from identical scripts can be alive at the same time.
+
+    Asserts:
+        - Overlapping modules are registered under distinct names.
+        - Exiting one context keeps the other module registered and inspectable.
+        - The source is unregistered from `linecache` once the last context exits.
+    """
+    with create_module(SCRIPT) as module:
+        with create_module(SCRIPT) as other:
+            assert other.__name__ != module.__name__
+            assert sys.modules[other.__name__] is other
+        assert sys.modules[module.__name__] is module
+        assert inspect.getsource(module.add) == SCRIPT
+    assert module.__file__ not in linecache.cache
+
+
+def test_dump_json() -> None:
+    """Tests that `dump_json` serializes models, lists, and dictionaries.
+
+    Asserts:
+        - `None` is serialized to an empty string.
+        - Models nested in lists and dictionaries are serialized as objects.
+        - Single models are serialized by alias, excluding unset fields.
+        - Serialized JSON fragments are embedded as they are.
+    """
+    content = TextContent(type="text", text="content")
+    assert dump_json(None) == ""
+    assert dump_json([content]) == '[{"type":"text","text":"content"}]'
+    assert dump_json({1: content}) == '{"1":{"type":"text","text":"content"}}'
+    assert dump_json(content) == '{"type":"text","text":"content"}'
+    fragment = orjson.Fragment('{"type":"text"}')
+    assert dump_json(fragment) == '{"type":"text"}'
+    assert dump_json({"content": fragment}) == '{"content":{"type":"text"}}'
+
+
+def test_ttl_cache() -> None:
+    """Tests that `TtlCache` expires entries and bounds their number.
+
+    Asserts:
+        - Fresh entries are returned, and expired ones are dropped on lookup.
+        - Expired entries are dropped when another entry is stored.
+        - The oldest entries are evicted once the cache exceeds its size.
+    """
+    cache: TtlCache[str, int] = TtlCache(ttl=10.0, maxsize=2)
+    with patch("mcp_server_unitycatalog.utils.time.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        assert cache.put("a", 1) == 1
+        assert cache.get("a") == 1
+        monotonic.return_value = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        cache.put("a", 1)
+        monotonic.return_value = 20.0
+        cache.put("b", 2)
+        assert len(cache) == 1
+        cache.put("c", 3)
+        cache.put("d", 4)
+        assert (cache.get("b"), cache.get("c"), cache.get("d")) == (None, 3, 4)
+        assert len(cache) == 2